@@ -1,10 +1,29 @@
-from flask import Flask, jsonify, request
+from flask import Flask, request, Response, stream_with_context
 from flask_cors import CORS
+import orjson
+import queue
 import yfinance as yf
 import pandas as pd
-from datetime import datetime
+import numpy as np
+import requests as http_requests
+import itertools
+import threading
+import time
+import asyncio
+import aiohttp
+from cachetools import TTLCache
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from requests.adapters import HTTPAdapter
 import logging
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    njit = None
+
 app = Flask(__name__)
 CORS(app, resources={
     r"/api/*": {
@@ -18,42 +37,272 @@ CORS(app, resources={
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _json_response(payload, status=200):
+    """Serialize with orjson instead of jsonify; numpy scalars pass through."""
+    return Response(orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+                    status=status, mimetype='application/json')
+
+# Shared session so all threads reuse the same connection pool
+# (requests.Session is thread-safe for GETs)
+session = http_requests.Session()
+session.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+# Keep enough pooled connections alive for the concurrent fetch paths so
+# requests don't pay fresh TCP + TLS handshakes
+session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+# Ticker objects cache their expiration list after the first download and
+# never refresh it, so an unbounded memo would go stale as dates lapse on
+# a long-lived worker; expire them after a few minutes instead
+ticker_cache = TTLCache(maxsize=512, ttl=300)
+ticker_cache_lock = threading.Lock()
+
+def _get_ticker(symbol):
+    """Reuse Ticker objects per symbol while they're fresh; construction
+    isn't free, but stale ones must not outlive their expiration list."""
+    with ticker_cache_lock:
+        ticker = ticker_cache.get(symbol)
+        if ticker is None:
+            ticker = yf.Ticker(symbol, session=session)
+            ticker_cache[symbol] = ticker
+    return ticker
+
+class RateLimiter:
+    """Sliding-window rate limiter shared by all outbound Yahoo requests.
+
+    acquire() only sleeps when the window is saturated, unlike the fixed
+    per-request sleeps it replaces.
+    """
+
+    def __init__(self, max_calls=60, period=60.0):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+                wait = self.period - (now - self._calls[0])
+            time.sleep(max(wait, 0.05))
+
+# Yahoo allows roughly 60 requests/min
+limiter = RateLimiter(max_calls=60, period=60.0)
+
+# Option chains change slowly intraday; cache fetches for 90s so repeat
+# scans of the same symbol don't hit Yahoo again
+chain_cache = TTLCache(maxsize=512, ttl=90)
+chain_cache_lock = threading.Lock()
+
+# Analysis is deterministic for a given chain snapshot, so memoize it too.
+# Snapshots are identified by a monotonic fetch_id stamped at fetch time;
+# object identity is not safe here since a cached analysis can outlive its
+# chain entry and alias a re-fetch at a recycled address.
+analysis_cache = TTLCache(maxsize=512, ttl=90)
+analysis_cache_lock = threading.Lock()
+_fetch_counter = itertools.count()
+
+def _reduce_side(vol, oi, iv):
+    """Sum volume and open interest and average IV in one pass.
+
+    One read of each column instead of six separate numpy reductions;
+    jitted with numba when available. vol and oi are int32 with missing
+    values already zeroed at extraction; only IV can still carry NaNs.
+    """
+    vol_sum = 0
+    oi_sum = 0
+    iv_sum = 0.0
+    iv_count = 0
+    for i in range(vol.size):
+        vol_sum += vol[i]
+        oi_sum += oi[i]
+        x = iv[i]
+        if not np.isnan(x):
+            iv_sum += x
+            iv_count += 1
+    iv_mean = iv_sum / iv_count if iv_count > 0 else np.nan
+    return vol_sum, oi_sum, iv_mean
+
+if njit is not None:
+    # No fastmath: the kernel relies on the IV NaN check, which fastmath elides
+    _reduce_side = njit(cache=True)(_reduce_side)
+    # Compile at import so the first request doesn't pay the JIT cost
+    _reduce_side(np.zeros(1, np.int32), np.zeros(1, np.int32), np.zeros(1, np.float32))
+
+# Columns we carry per chain side; everything else Yahoo sends is dropped
+# at extraction time
+CHAIN_COLUMNS = ('strike', 'lastPrice', 'volume', 'openInterest', 'impliedVolatility')
+
+# Narrow only the columns the reductions read: counts fit in int32 and IV
+# in float32, halving the bytes per pass. strike and lastPrice are never
+# reduced — they're echoed back in the top-strike records, where a float32
+# round trip would dirty the JSON (0.93 -> 0.9300000071...), so they stay
+# float64.
+INT_COLUMNS = ('volume', 'openInterest')
+FLOAT32_COLUMNS = ('impliedVolatility',)
+
+def _cast_column(col, values):
+    """Narrow a float64 reduction column: counts to int32 (NaN as 0), IV to
+    float32; output-only columns pass through unchanged."""
+    if col in INT_COLUMNS:
+        return np.nan_to_num(values).astype(np.int32)
+    if col in FLOAT32_COLUMNS:
+        return values.astype(np.float32)
+    return values
+
+def _frame_arrays(df, exp_label, exp_code):
+    """Extract one chain side from a DataFrame as a dict of column arrays."""
+    n = len(df)
+    side = {
+        col: _cast_column(col, df[col].to_numpy(dtype=np.float64)
+                          if col in df.columns else np.full(n, np.nan))
+        for col in CHAIN_COLUMNS
+    }
+    side['expiration'] = np.full(n, exp_label, dtype=object)
+    side['exp_code'] = np.full(n, exp_code, dtype=np.int32)
+    return side
+
+def _contract_arrays(contracts, exp_label, exp_code):
+    """Extract one chain side from raw contract records, no DataFrame at all."""
+    side = {
+        col: _cast_column(col, np.array(
+            [c.get(col) if c.get(col) is not None else np.nan for c in contracts],
+            dtype=np.float64))
+        for col in CHAIN_COLUMNS
+    }
+    side['expiration'] = np.full(len(contracts), exp_label, dtype=object)
+    side['exp_code'] = np.full(len(contracts), exp_code, dtype=np.int32)
+    return side
+
+def _concat_sides(sides):
+    """Concatenate per-expiration column dicts into one column dict."""
+    return {key: np.concatenate([side[key] for side in sides]) for key in sides[0]}
+
+# Deepest top-K any consumer needs (top-strikes endpoint)
+MAX_TOP_K = 10
+
+def _top_volume_idx(volumes, k):
+    """Indices of the k highest volumes, in descending order.
+
+    np.argpartition selects the top k in O(N) and only those k get
+    sorted, versus the full sort pandas nlargest performs.
+    """
+    vols = np.nan_to_num(volumes, nan=-1.0)
+    k = min(k, vols.size)
+    top_idx = np.argpartition(-vols, k - 1)[:k] if k > 0 else np.empty(0, dtype=np.intp)
+    return top_idx[np.argsort(-vols[top_idx])]
+
+def _records(side, indices, columns):
+    """Materialize the given rows of a column dict as plain-dict records."""
+    records = []
+    for i in indices:
+        record = {}
+        for col in columns:
+            value = side[col][i]
+            if isinstance(value, np.float32):
+                # float32 noise (0.35 -> 0.3499999940...) must not leak
+                # into the JSON payload
+                value = round(float(value), 6)
+            elif isinstance(value, np.generic):
+                value = value.item()
+            record[col] = value
+        records.append(record)
+    return records
+
+def _prepare(data):
+    """Lazily derive the values both analysis endpoints share for one fetch.
+
+    Computed on first access and stored on the fetch dict itself, so it
+    lives (and evicts) with the chain cache entry. Holds, per side, the
+    single-pass reductions, the top-10 volume order and the
+    volume-by-expiration sums.
+    """
+    prepared = data.get('_prepared')
+    if prepared is None:
+        prepared = {}
+        for name in ('calls', 'puts'):
+            side = data[name]
+            vol_sum, oi_sum, iv_mean = _reduce_side(
+                side['volume'], side['openInterest'], side['impliedVolatility'])
+            prepared[name] = SimpleNamespace(
+                vol_sum=vol_sum,
+                oi_sum=oi_sum,
+                iv_mean=iv_mean,
+                top_idx=_top_volume_idx(side['volume'], MAX_TOP_K),
+                vol_by_exp=_volume_by_expiration(side['exp_code'], side['volume'],
+                                                 data['expirations'])
+            )
+        data['_prepared'] = prepared
+    return prepared
+
+def _volume_by_expiration(exp_codes, volumes, expirations):
+    """Sum volumes per expiration date.
+
+    Rows carry integer expiration codes assigned at extraction, shared by
+    both sides, so each sum is one bincount over contiguous arrays - no
+    hashing or per-call factorization.
+    """
+    sums = np.bincount(exp_codes, weights=volumes, minlength=len(expirations))
+    return dict(zip(expirations, sums.astype(int).tolist()))
+
 class OptionsDataFetcher:
     """Fetch and analyze options data for stocks."""
     
     @staticmethod
-    def get_options_data(symbol):
-        """Fetch options data for a symbol."""
+    def get_options_data(symbol, current_price=None, refresh=False):
+        """Fetch options data for a symbol, served from the TTL cache when warm.
+
+        Pass refresh=True to bypass the cache and force a fresh fetch.
+        """
+        key = symbol.upper()
+
+        if not refresh:
+            with chain_cache_lock:
+                cached = chain_cache.get(key)
+            if cached is not None:
+                return cached
+
+        data = OptionsDataFetcher._fetch_options_data(key, current_price)
+
+        with chain_cache_lock:
+            if data is not None:
+                chain_cache[key] = data
+            else:
+                # Don't pin a stale entry behind a failed refresh
+                chain_cache.pop(key, None)
+
+        return data
+
+    @staticmethod
+    def _fetch_options_data(symbol, current_price=None):
+        """Fetch options data for a symbol from Yahoo.
+
+        Pass current_price to skip the per-symbol price fetch (e.g. when
+        prices were already retrieved in a batched download).
+        """
         try:
-            import time
-            import requests
-            
-            # Create session with headers to avoid blocking
-            session = requests.Session()
-            session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            })
-            
-            # Create ticker with custom session
-            ticker = yf.Ticker(symbol, session=session)
-            
-            # Small delay to avoid rate limiting
-            time.sleep(0.5)
-            
-            # Get stock price with error handling
-            try:
-                stock_info = ticker.history(period='1d')
-                if stock_info.empty:
-                    # Try alternative method
-                    info = ticker.info
-                    current_price = float(info.get('currentPrice', info.get('regularMarketPrice', 0)))
-                else:
-                    current_price = float(stock_info['Close'].iloc[-1])
-            except Exception as e:
-                logger.warning(f"Could not get price for {symbol}: {e}")
-                current_price = 0
+            ticker = _get_ticker(symbol)
+
+            # Get stock price with error handling (unless already provided);
+            # fast_info is a single lightweight call versus the OHLCV
+            # download of history() or the full quoteSummary of info
+            if current_price is None:
+                try:
+                    limiter.acquire()
+                    current_price = float(ticker.fast_info['lastPrice'])
+                except Exception as e:
+                    logger.warning(f"Could not get price for {symbol}: {e}")
+                    current_price = 0
             
             # Get all expiration dates
+            limiter.acquire()
             expirations = ticker.options
             if not expirations or len(expirations) == 0:
                 logger.warning(f"No options available for {symbol}")
@@ -62,43 +311,52 @@ class OptionsDataFetcher:
             # Focus on near-term expirations
             near_expirations = expirations[:min(4, len(expirations))]
             
-            all_calls = []
-            all_puts = []
-            
-            for exp_date in near_expirations:
+            def _fetch_chain(exp_date):
                 try:
-                    opt_chain = ticker.option_chain(exp_date)
-                    
-                    calls = opt_chain.calls.copy()
-                    puts = opt_chain.puts.copy()
-                    
-                    if calls.empty or puts.empty:
-                        continue
-                        
-                    calls['expiration'] = exp_date
-                    puts['expiration'] = exp_date
-                    
-                    all_calls.append(calls)
-                    all_puts.append(puts)
-                    
-                    # Small delay between requests
-                    time.sleep(0.3)
-                    
+                    limiter.acquire()
+                    return exp_date, ticker.option_chain(exp_date)
                 except Exception as e:
                     logger.warning(f"Error fetching options chain for {symbol} exp {exp_date}: {e}")
+                    return exp_date, None
+
+            # Fetch the (up to 4) expiration chains concurrently; the shared
+            # session pools connections to Yahoo, so no inter-request delay
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                chains = list(executor.map(_fetch_chain, near_expirations))
+
+            all_calls = []
+            all_puts = []
+
+            kept_expirations = []
+
+            for exp_date, opt_chain in chains:
+                if opt_chain is None:
                     continue
-            
+
+                calls = opt_chain.calls
+                puts = opt_chain.puts
+
+                if calls.empty or puts.empty:
+                    continue
+
+                # Keep only the columns we analyze, as plain arrays; the
+                # per-expiration frames never get concatenated. Both sides
+                # share the expiration code assigned here.
+                code = len(kept_expirations)
+                all_calls.append(_frame_arrays(calls, exp_date, code))
+                all_puts.append(_frame_arrays(puts, exp_date, code))
+                kept_expirations.append(exp_date)
+
             if not all_calls or not all_puts:
                 logger.warning(f"No valid options data for {symbol}")
                 return None
-            
-            calls_df = pd.concat(all_calls, ignore_index=True)
-            puts_df = pd.concat(all_puts, ignore_index=True)
-            
+
             return {
-                'calls': calls_df,
-                'puts': puts_df,
-                'current_price': current_price
+                'calls': _concat_sides(all_calls),
+                'puts': _concat_sides(all_puts),
+                'current_price': current_price,
+                'expirations': kept_expirations,
+                'fetch_id': next(_fetch_counter)
             }
             
         except Exception as e:
@@ -110,35 +368,48 @@ class OptionsDataFetcher:
     @staticmethod
     def analyze_options(symbol, data):
         """Analyze options data and return metrics."""
-        calls_df = data['calls']
-        puts_df = data['puts']
-        
-        # Calculate volumes
-        total_call_volume = int(calls_df['volume'].fillna(0).sum())
-        total_put_volume = int(puts_df['volume'].fillna(0).sum())
-        
-        # Calculate open interest
-        total_call_oi = int(calls_df['openInterest'].fillna(0).sum())
-        total_put_oi = int(puts_df['openInterest'].fillna(0).sum())
-        
+        calls = data['calls']
+        puts = data['puts']
+
+        cache_key = (symbol, data['fetch_id'])
+        with analysis_cache_lock:
+            cached = analysis_cache.get(cache_key)
+        if cached is not None:
+            # Copy so callers can add fields (e.g. flagged) without
+            # polluting the cache, and stamp a fresh timestamp
+            result = dict(cached)
+            result['timestamp'] = datetime.now().isoformat()
+            return result
+
+        # Reductions, top-volume order and expiration sums are shared with
+        # the top-strikes endpoint and computed once per cached fetch
+        prepared = _prepare(data)
+        call_stats = prepared['calls']
+        put_stats = prepared['puts']
+
+        total_call_volume = int(call_stats.vol_sum)
+        total_put_volume = int(put_stats.vol_sum)
+        total_call_oi = int(call_stats.oi_sum)
+        total_put_oi = int(put_stats.oi_sum)
+        avg_call_iv = call_stats.iv_mean
+        avg_put_iv = put_stats.iv_mean
+
         # Calculate call/put ratio
         call_put_ratio = round(total_call_volume / total_put_volume, 2) if total_put_volume > 0 else 0
-        
-        # Calculate average implied volatility
-        avg_call_iv = calls_df['impliedVolatility'].mean()
-        avg_put_iv = puts_df['impliedVolatility'].mean()
-        
+
         # Find most active call strikes
-        top_calls = calls_df.nlargest(5, 'volume')[['strike', 'volume', 'openInterest', 'lastPrice', 'expiration']].to_dict('records')
-        
+        top_calls = _records(calls, call_stats.top_idx[:5],
+                             ['strike', 'volume', 'openInterest', 'lastPrice', 'expiration'])
+
         # Find most active put strikes
-        top_puts = puts_df.nlargest(5, 'volume')[['strike', 'volume', 'openInterest', 'lastPrice', 'expiration']].to_dict('records')
-        
+        top_puts = _records(puts, put_stats.top_idx[:5],
+                            ['strike', 'volume', 'openInterest', 'lastPrice', 'expiration'])
+
         # Calculate volume distribution by expiration
-        call_vol_by_exp = calls_df.groupby('expiration')['volume'].sum().to_dict()
-        put_vol_by_exp = puts_df.groupby('expiration')['volume'].sum().to_dict()
-        
-        return {
+        call_vol_by_exp = call_stats.vol_by_exp
+        put_vol_by_exp = put_stats.vol_by_exp
+
+        result = {
             'symbol': symbol,
             'currentPrice': data['current_price'],
             'callVolume': total_call_volume,
@@ -155,26 +426,38 @@ class OptionsDataFetcher:
             'timestamp': datetime.now().isoformat()
         }
 
+        with analysis_cache_lock:
+            analysis_cache[cache_key] = result
+
+        return dict(result)
+
 # Initialize fetcher
 fetcher = OptionsDataFetcher()
 
+# Static payloads rendered once at import; only the health timestamp
+# varies per request
+_INDEX_PAYLOAD = orjson.dumps({
+    'status': 'running',
+    'message': 'Options Flow Monitor API',
+    'endpoints': {
+        '/api/scan/<symbol>': 'Get options data for a single symbol',
+        '/api/scan-multiple': 'Get options data for multiple symbols (POST)',
+        '/api/health': 'Health check'
+    }
+})
+
+_HEALTH_PREFIX = b'{"status":"healthy","timestamp":"'
+
 @app.route('/')
 def index():
     """Root endpoint."""
-    return jsonify({
-        'status': 'running',
-        'message': 'Options Flow Monitor API',
-        'endpoints': {
-            '/api/scan/<symbol>': 'Get options data for a single symbol',
-            '/api/scan-multiple': 'Get options data for multiple symbols (POST)',
-            '/api/health': 'Health check'
-        }
-    })
+    return Response(_INDEX_PAYLOAD, mimetype='application/json')
 
 @app.route('/api/health')
 def health():
     """Health check endpoint."""
-    return jsonify({'status': 'healthy', 'timestamp': datetime.now().isoformat()})
+    body = _HEALTH_PREFIX + datetime.now().isoformat().encode() + b'"}'
+    return Response(body, mimetype='application/json')
 
 @app.route('/api/scan/<symbol>')
 def scan_symbol(symbol):
@@ -182,21 +465,193 @@ def scan_symbol(symbol):
     try:
         symbol = symbol.upper()
         logger.info(f"Scanning {symbol}")
-        
-        data = fetcher.get_options_data(symbol)
+
+        refresh = request.args.get('refresh') == '1'
+        data = fetcher.get_options_data(symbol, refresh=refresh)
         
         if data is None:
-            return jsonify({
+            return _json_response({
                 'error': f'Could not fetch data for {symbol}',
                 'symbol': symbol
-            }), 404
+            }, 404)
         
         analysis = fetcher.analyze_options(symbol, data)
-        return jsonify(analysis)
+        return _json_response(analysis)
         
     except Exception as e:
         logger.error(f"Error in scan_symbol: {e}")
-        return jsonify({'error': str(e)}), 500
+        return _json_response({'error': str(e)}, 500)
+
+# Direct Yahoo options endpoint: one response carries the quote, the
+# expiration list and one chain, bypassing yfinance for bulk scans
+OPTIONS_URL = 'https://query1.finance.yahoo.com/v7/finance/options/{symbol}'
+
+# Bound on in-flight requests from the async scan path. A threading
+# semaphore at module scope so the cap holds across all concurrent
+# scan-multiple requests (each runs its own event loop); asyncio
+# primitives can't be shared between loops.
+ASYNC_SCAN_CONCURRENCY = 8
+scan_semaphore = threading.Semaphore(ASYNC_SCAN_CONCURRENCY)
+
+def _acquire_fetch_slot():
+    """Blocking: take a concurrency slot, then a rate-limiter slot.
+
+    Run via asyncio.to_thread so the async path honors the same global
+    limiter as every yfinance call; the semaphore bounds how many
+    requests are in flight, the limiter bounds how fast they're issued.
+    """
+    scan_semaphore.acquire()
+    limiter.acquire()
+
+async def _fetch_options_async(http, symbol):
+    """Async counterpart of _fetch_options_data using the raw v7 endpoint."""
+    url = OPTIONS_URL.format(symbol=symbol)
+
+    async def get_json(params=None):
+        await asyncio.to_thread(_acquire_fetch_slot)
+        try:
+            async with http.get(url, params=params) as resp:
+                resp.raise_for_status()
+                return await resp.json()
+        finally:
+            scan_semaphore.release()
+
+    payload = await get_json()
+    result = payload.get('optionChain', {}).get('result') or []
+    if not result:
+        logger.warning(f"No options available for {symbol}")
+        return None
+    result = result[0]
+
+    quote = result.get('quote') or {}
+    current_price = float(quote.get('regularMarketPrice') or 0)
+
+    # Focus on near-term expirations (epoch seconds)
+    near_expirations = (result.get('expirationDates') or [])[:4]
+    if not near_expirations:
+        logger.warning(f"No options available for {symbol}")
+        return None
+
+    # The base response already includes the first chain; fetch the rest
+    # concurrently with ?date=<epoch>
+    chains = {}
+    for chain in result.get('options') or []:
+        chains[chain.get('expirationDate')] = chain
+
+    async def fetch_chain(epoch):
+        try:
+            extra = await get_json(params={'date': epoch})
+            extra_result = (extra.get('optionChain', {}).get('result') or [{}])[0]
+            options = extra_result.get('options') or []
+            return epoch, options[0] if options else None
+        except Exception as e:
+            logger.warning(f"Error fetching options chain for {symbol} exp {epoch}: {e}")
+            return epoch, None
+
+    missing = [e for e in near_expirations if e not in chains]
+    for epoch, chain in await asyncio.gather(*(fetch_chain(e) for e in missing)):
+        chains[epoch] = chain
+
+    all_calls = []
+    all_puts = []
+    kept_expirations = []
+
+    for epoch in near_expirations:
+        chain = chains.get(epoch)
+        if not chain:
+            continue
+
+        calls = chain.get('calls') or []
+        puts = chain.get('puts') or []
+
+        if not calls or not puts:
+            continue
+
+        exp_label = datetime.fromtimestamp(epoch, tz=timezone.utc).strftime('%Y-%m-%d')
+        code = len(kept_expirations)
+        all_calls.append(_contract_arrays(calls, exp_label, code))
+        all_puts.append(_contract_arrays(puts, exp_label, code))
+        kept_expirations.append(exp_label)
+
+    if not all_calls or not all_puts:
+        logger.warning(f"No valid options data for {symbol}")
+        return None
+
+    return {
+        'calls': _concat_sides(all_calls),
+        'puts': _concat_sides(all_puts),
+        'current_price': current_price,
+        'expirations': kept_expirations,
+        'fetch_id': next(_fetch_counter)
+    }
+
+async def _scan_one_async(http, symbol, call_vol_threshold, ratio_threshold, refresh):
+    """Scan a single symbol on the event loop (never raises)."""
+    try:
+        logger.info(f"Scanning {symbol}")
+
+        options_data = None
+        if not refresh:
+            with chain_cache_lock:
+                options_data = chain_cache.get(symbol)
+
+        if options_data is None:
+            options_data = await _fetch_options_async(http, symbol)
+            with chain_cache_lock:
+                if options_data is not None:
+                    chain_cache[symbol] = options_data
+                else:
+                    chain_cache.pop(symbol, None)
+
+        if options_data is None:
+            return {
+                'symbol': symbol,
+                'error': 'Could not fetch data',
+                'flagged': False
+            }
+
+        analysis = fetcher.analyze_options(symbol, options_data)
+
+        # Determine if flagged
+        analysis['flagged'] = (
+            analysis['callVolume'] >= call_vol_threshold and
+            analysis['ratio'] >= ratio_threshold
+        )
+
+        return analysis
+
+    except Exception as e:
+        logger.error(f"Error scanning {symbol}: {e}")
+        return {
+            'symbol': symbol,
+            'error': str(e),
+            'flagged': False
+        }
+
+async def _scan_all_async(symbols, call_vol_threshold, ratio_threshold,
+                          refresh=False, on_result=None):
+    """Scan many symbols concurrently over a single aiohttp session.
+
+    on_result, when given, is called with each result as soon as its
+    symbol completes (used by the streaming response).
+    """
+    timeout = aiohttp.ClientTimeout(total=60)
+
+    async with aiohttp.ClientSession(headers=dict(session.headers), timeout=timeout) as http:
+        tasks = [
+            asyncio.ensure_future(_scan_one_async(http, symbol,
+                                                  call_vol_threshold, ratio_threshold, refresh))
+            for symbol in symbols
+        ]
+
+        results = []
+        for task in asyncio.as_completed(tasks):
+            result = await task
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+
+    return results
 
 @app.route('/api/scan-multiple', methods=['POST'])
 def scan_multiple():
@@ -206,87 +661,83 @@ def scan_multiple():
         symbols = data.get('symbols', [])
         call_vol_threshold = data.get('callVolThreshold', 5000)
         ratio_threshold = data.get('ratioThreshold', 2.0)
-        
+        refresh = bool(data.get('refresh', False)) or request.args.get('refresh') == '1'
+
         if not symbols:
-            return jsonify({'error': 'No symbols provided'}), 400
-        
-        results = []
-        
-        for symbol in symbols:
-            try:
-                symbol = symbol.upper().strip()
-                logger.info(f"Scanning {symbol}")
-                
-                options_data = fetcher.get_options_data(symbol)
-                
-                if options_data is None:
-                    results.append({
-                        'symbol': symbol,
-                        'error': 'Could not fetch data',
-                        'flagged': False
-                    })
-                    continue
-                
-                analysis = fetcher.analyze_options(symbol, options_data)
-                
-                # Determine if flagged
-                analysis['flagged'] = (
-                    analysis['callVolume'] >= call_vol_threshold and 
-                    analysis['ratio'] >= ratio_threshold
-                )
-                
-                results.append(analysis)
-                
-            except Exception as e:
-                logger.error(f"Error scanning {symbol}: {e}")
-                results.append({
-                    'symbol': symbol,
-                    'error': str(e),
-                    'flagged': False
-                })
-        
-        # Calculate summary statistics
-        valid_results = [r for r in results if 'error' not in r]
-        summary = {
-            'totalScanned': len(results),
-            'successfulScans': len(valid_results),
-            'flaggedCount': sum(1 for r in valid_results if r.get('flagged', False)),
-            'avgRatio': round(sum(r['ratio'] for r in valid_results) / len(valid_results), 2) if valid_results else 0,
-            'timestamp': datetime.now().isoformat()
-        }
-        
-        return jsonify({
-            'summary': summary,
-            'results': results
-        })
-        
+            return _json_response({'error': 'No symbols provided'}, 400)
+
+        symbols = [s.upper().strip() for s in symbols]
+
+        def generate():
+            # Run the scan on a background event loop and stream each
+            # result the moment its symbol completes; clients parse one
+            # JSON object per line and get a summary as the final line
+            results_queue = queue.Queue()
+
+            def worker():
+                try:
+                    asyncio.run(
+                        _scan_all_async(symbols, call_vol_threshold, ratio_threshold,
+                                        refresh, on_result=results_queue.put)
+                    )
+                except Exception as e:
+                    logger.error(f"Error in scan_multiple: {e}")
+                finally:
+                    results_queue.put(None)
+
+            threading.Thread(target=worker, daemon=True).start()
+
+            results = []
+            while True:
+                result = results_queue.get()
+                if result is None:
+                    break
+                results.append(result)
+                yield orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY) + b'\n'
+
+            # Calculate summary statistics
+            valid_results = [r for r in results if 'error' not in r]
+            summary = {
+                'totalScanned': len(results),
+                'successfulScans': len(valid_results),
+                'flaggedCount': sum(1 for r in valid_results if r.get('flagged', False)),
+                'avgRatio': round(sum(r['ratio'] for r in valid_results) / len(valid_results), 2) if valid_results else 0,
+                'timestamp': datetime.now().isoformat()
+            }
+
+            yield orjson.dumps({'summary': summary}) + b'\n'
+
+        return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
     except Exception as e:
         logger.error(f"Error in scan_multiple: {e}")
-        return jsonify({'error': str(e)}), 500
+        return _json_response({'error': str(e)}, 500)
 
 @app.route('/api/top-strikes/<symbol>')
 def top_strikes(symbol):
     """Get detailed information about top option strikes."""
     try:
         symbol = symbol.upper()
-        data = fetcher.get_options_data(symbol)
+        refresh = request.args.get('refresh') == '1'
+        data = fetcher.get_options_data(symbol, refresh=refresh)
         
         if data is None:
-            return jsonify({'error': f'Could not fetch data for {symbol}'}), 404
-        
-        calls_df = data['calls']
-        puts_df = data['puts']
-        
-        # Get top 10 by volume for both calls and puts
-        top_calls = calls_df.nlargest(10, 'volume')[
+            return _json_response({'error': f'Could not fetch data for {symbol}'}, 404)
+
+        # Get top 10 by volume for both calls and puts; the order is
+        # shared with analyze_options via the prepared cache entry
+        prepared = _prepare(data)
+        top_calls = _records(
+            data['calls'], prepared['calls'].top_idx,
             ['strike', 'lastPrice', 'volume', 'openInterest', 'impliedVolatility', 'expiration']
-        ].to_dict('records')
-        
-        top_puts = puts_df.nlargest(10, 'volume')[
+        )
+
+        top_puts = _records(
+            data['puts'], prepared['puts'].top_idx,
             ['strike', 'lastPrice', 'volume', 'openInterest', 'impliedVolatility', 'expiration']
-        ].to_dict('records')
+        )
         
-        return jsonify({
+        return _json_response({
             'symbol': symbol,
             'currentPrice': data['current_price'],
             'topCalls': top_calls,
@@ -296,8 +747,10 @@ def top_strikes(symbol):
         
     except Exception as e:
         logger.error(f"Error in top_strikes: {e}")
-        return jsonify({'error': str(e)}), 500
-# For production deployment
+        return _json_response({'error': str(e)}, 500)
+# For production deployment: the workload is IO-bound on Yahoo, so run
+# under threaded gunicorn workers to overlap concurrent requests' waits:
+#   gunicorn -w 2 -k gthread --threads 16 --timeout 120 app:app
 if __name__ != '__main__':
     # Gunicorn config
     import logging
@@ -316,5 +769,7 @@ if __name__ == '__main__':
     print("  GET  /api/health               - Health check")
     print("\nPress Ctrl+C to stop the server")
     print("=" * 60)
-    
-    app.run(debug=True, host='0.0.0.0', port=5000)
+
+    # Threaded so local concurrent scans overlap their HTTP waits too;
+    # debug mode's reloader added per-request overhead for no benefit
+    app.run(host='0.0.0.0', port=5000, threaded=True)